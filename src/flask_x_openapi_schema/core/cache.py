@@ -1,30 +1,115 @@
 """Simplified caching mechanism for OpenAPI schema generation.
 
-This module provides a minimal caching system focused only on the essential
-caching needs for the @openapi_metadata decorator. It uses WeakKeyDictionary
-to avoid memory leaks when functions are garbage collected.
+This module provides a minimal caching system for the @openapi_metadata decorator
+and for the per-model lookups made while handling requests, such as detecting
+file upload fields. It uses WeakKeyDictionary to avoid memory leaks when functions
+or dynamically created models are garbage collected.
 
 Cache Types:
     - WeakKeyDictionary: For function metadata to avoid memory leaks
+    - WeakKeyDictionary: For per-model field type mappings, keyed by model class
+    - WeakKeyDictionary: For per-model file upload field names, keyed by model class
 
 Thread Safety:
     This module is designed to be thread-safe for use in multi-threaded web servers.
 """
 
 import weakref
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
+from pydantic import BaseModel
+
+from .config import GLOBAL_CONFIG_HOLDER
+
 # Cache for decorated functions to avoid recomputing metadata (weak references)
 # This uses WeakKeyDictionary to avoid memory leaks when functions are garbage collected
 FUNCTION_METADATA_CACHE = weakref.WeakKeyDictionary()
 
+# Cache for field name -> annotation mappings of Pydantic models.
+# Keyed by the model class itself so entries go away with dynamically created models.
+# Values are read-only so they can be shared without defensive copies
+MODEL_CACHE = weakref.WeakKeyDictionary()
+
+# Cache for the names of FileField / list[FileField] fields of Pydantic models,
+# filled by content_type_utils.get_file_field_names()
+FILE_FIELDS_CACHE = weakref.WeakKeyDictionary()
+
+# Every cache owned by this module; clear_all_caches() clears each of them
+_ALL_CACHES: tuple[weakref.WeakKeyDictionary, ...] = (FUNCTION_METADATA_CACHE, MODEL_CACHE, FILE_FIELDS_CACHE)
+
+# Shared read-only result for endpoints without request body or query models
+_EMPTY_PARAM_TYPES: Mapping[str, Any] = MappingProxyType({})
+
 
 def clear_all_caches() -> None:
     """Clear all caches to free memory or force regeneration.
 
-    This function clears the function metadata cache.
+    This function clears the function metadata cache and the per-model field caches.
+    New caches only need to be added to ``_ALL_CACHES`` to be cleared here.
+    """
+    for cache in _ALL_CACHES:
+        cache.clear()
+
+
+def _get_model_types(model: type[BaseModel] | None) -> Mapping[str, Any] | None:
+    """Get the cached field name -> annotation mapping of a Pydantic model.
+
+    Args:
+        model: The model class, or None
+
+    Returns:
+        Read-only mapping of field names to annotations, or None if model is not a Pydantic model
+
     """
-    FUNCTION_METADATA_CACHE.clear()
+    if not (isinstance(model, type) and issubclass(model, BaseModel)):
+        return None
+
+    model_types = MODEL_CACHE.get(model)
+    if model_types is None:
+        model_types = MappingProxyType(
+            {field_name: field.annotation for field_name, field in model.model_fields.items()}
+        )
+        MODEL_CACHE[model] = model_types
+
+    return model_types
+
+
+def extract_param_types(
+    request_body_model: type[BaseModel] | None,
+    query_model: type[BaseModel] | None,
+) -> Mapping[str, Any]:
+    """Extract parameter types from the request body and query models.
+
+    Args:
+        request_body_model: The request body model, if any
+        query_model: The query parameters model, if any
+
+    Returns:
+        Mapping of field names to their annotations, with query model fields
+        taking precedence over request body fields. The result must not be mutated.
+
+    Examples:
+        >>> from pydantic import BaseModel
+        >>> class Body(BaseModel):
+        ...     name: str
+        >>> class Query(BaseModel):
+        ...     page: int
+        >>> extract_param_types(Body, Query)
+        {'name': <class 'str'>, 'page': <class 'int'>}
+
+    """
+    body_types = _get_model_types(request_body_model)
+    query_types = _get_model_types(query_model)
+
+    # With a single model, hand out its cached read-only mapping instead of copying it
+    if query_types is None:
+        return _EMPTY_PARAM_TYPES if body_types is None else body_types
+    if body_types is None:
+        return query_types
+
+    return {**body_types, **query_types}
 
 
 def get_parameter_prefixes(config: Any | None = None) -> tuple[str, str, str, str]:
@@ -39,15 +124,14 @@ def get_parameter_prefixes(config: Any | None = None) -> tuple[str, str, str, st
         Tuple of (body_prefix, query_prefix, path_prefix, file_prefix)
 
     """
-    from .config import GLOBAL_CONFIG_HOLDER
-
-    # If config is None, use global config
-    prefix_config = GLOBAL_CONFIG_HOLDER.get() if config is None else config
+    # If config is None, use the prefixes precomputed by the global config holder
+    if config is None:
+        return GLOBAL_CONFIG_HOLDER.get_prefixes()
 
     # Extract the prefixes directly
     return (
-        prefix_config.request_body_prefix,
-        prefix_config.request_query_prefix,
-        prefix_config.request_path_prefix,
-        prefix_config.request_file_prefix,
+        config.request_body_prefix,
+        config.request_query_prefix,
+        config.request_path_prefix,
+        config.request_file_prefix,
     )
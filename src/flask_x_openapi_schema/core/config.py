@@ -115,8 +115,18 @@ class ThreadSafeConfig:
         self._prefix_config = ConventionalPrefixConfig()
         self._openapi_config = OpenAPIConfig()
         self._cache_config = CacheConfig(enabled=True)
+        self._prefixes = self._build_prefixes(self._prefix_config)
         self._lock = threading.RLock()
 
+    @staticmethod
+    def _build_prefixes(config: ConventionalPrefixConfig) -> tuple[str, str, str, str]:
+        return (
+            config.request_body_prefix,
+            config.request_query_prefix,
+            config.request_path_prefix,
+            config.request_file_prefix,
+        )
+
     def get(self) -> ConventionalPrefixConfig:
         """Get the current prefix configuration.
 
@@ -134,6 +144,20 @@ class ThreadSafeConfig:
                 extra_options=dict(self._prefix_config.extra_options),
             )
 
+    def get_prefixes(self) -> tuple[str, str, str, str]:
+        """Get the current parameter prefixes.
+
+        The tuple is built once whenever the prefix configuration changes, so this
+        is cheaper than ``get()`` on per-request paths. It is read without taking
+        the lock: writers replace the whole immutable tuple, and rebinding an
+        attribute is atomic, so readers always see either the old or the new one.
+
+        Returns:
+            tuple[str, str, str, str]: (body_prefix, query_prefix, path_prefix, file_prefix)
+
+        """
+        return self._prefixes
+
     def get_cache_config(self) -> CacheConfig:
         """Get the current cache configuration.
 
@@ -187,6 +211,7 @@ class ThreadSafeConfig:
                 request_file_prefix=config.request_file_prefix,
                 extra_options=dict(config.extra_options),
             )
+            self._prefixes = self._build_prefixes(self._prefix_config)
 
     def set_openapi_config(self, config: OpenAPIConfig) -> None:
         """Set a new OpenAPI configuration.
@@ -241,6 +266,7 @@ class ThreadSafeConfig:
                 request_file_prefix=DEFAULT_FILE_PREFIX,
                 extra_options={},
             )
+            self._prefixes = self._build_prefixes(self._prefix_config)
 
     def reset_all(self) -> None:
         """Reset all configurations to defaults.
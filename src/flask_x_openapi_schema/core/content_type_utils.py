@@ -7,6 +7,7 @@ and processing request data based on content types.
 
 import io
 import json
+import logging
 import tempfile
 import urllib
 from abc import ABC, abstractmethod
@@ -18,13 +19,13 @@ from flask import make_response
 from pydantic import BaseModel, ValidationError
 from werkzeug.datastructures import FileStorage
 
+from flask_x_openapi_schema.core.cache import FILE_FIELDS_CACHE
 from flask_x_openapi_schema.core.error_handlers import (
     create_error_response,
     create_status_error_response,
     handle_request_validation_error,
     handle_validation_error,
 )
-from flask_x_openapi_schema.core.logger import get_logger
 from flask_x_openapi_schema.core.request_extractors import ModelFactory, safe_operation
 from flask_x_openapi_schema.core.request_processing import preprocess_request_data
 from flask_x_openapi_schema.models.base import BaseErrorResponse
@@ -33,6 +34,11 @@ from flask_x_openapi_schema.models.content_types import (
 )
 from flask_x_openapi_schema.models.file_models import FileField
 
+logger = logging.getLogger(__name__)
+
+# Maximum number of distinct media types remembered by ContentTypeRegistry
+MAX_RESOLVED_CONTENT_TYPES = 128
+
 
 class ContentTypeStrategy(ABC):
     """Abstract base class for content type processing strategies.
@@ -45,6 +51,10 @@ class ContentTypeStrategy(ABC):
     def can_handle(self, content_type: str) -> bool:
         """Check if this strategy can handle the given content type.
 
+        ``ContentTypeRegistry`` resolves strategies per media type, so it passes the
+        lowercased media type without parameters (e.g. ``"multipart/form-data"``
+        rather than ``"multipart/form-data; boundary=..."``) and remembers the result.
+
         Args:
             content_type: The content type to check.
 
@@ -101,8 +111,7 @@ class JsonContentTypeStrategy(ContentTypeStrategy):
             Dict[str, Any]: Updated kwargs dictionary with the model instance.
 
         """
-        logger = get_logger(__name__)
-        logger.debug(f"Processing JSON request for {param_name} with model {model.__name__}")
+        logger.debug("Processing JSON request for %s with model %s", param_name, model.__name__)
 
         json_data = request.get_json(silent=True)
         if json_data:
@@ -110,13 +119,13 @@ class JsonContentTypeStrategy(ContentTypeStrategy):
                 model_instance = model.model_validate(json_data)
                 kwargs[param_name] = model_instance
             except ValidationError as e:
-                logger.warning(f"Validation error for {model.__name__}: {e}")
+                logger.warning("Validation error for %s: %s", model.__name__, e)
 
                 error_response = handle_validation_error(e)
 
                 return make_response(*error_response)
             except Exception as e:
-                logger.exception(f"Failed to validate JSON data against model {model.__name__}", exc_info=e)
+                logger.exception("Failed to validate JSON data against model %s", model.__name__, exc_info=e)
 
                 error_response = handle_request_validation_error(model.__name__, e)
 
@@ -128,7 +137,7 @@ class JsonContentTypeStrategy(ContentTypeStrategy):
             model_instance = model()
             kwargs[param_name] = model_instance
         except Exception as e:
-            logger.exception(f"Failed to create empty model instance for {model.__name__}")
+            logger.exception("Failed to create empty model instance for %s", model.__name__)
 
             error_response = create_status_error_response(
                 status_code=500,
@@ -171,12 +180,11 @@ class MultipartFormDataStrategy(ContentTypeStrategy):
             Dict[str, Any]: Updated kwargs dictionary with the model instance.
 
         """
-        logger = get_logger(__name__)
-        logger.debug(f"Processing multipart/form-data request for {param_name} with model {model.__name__}")
+        logger.debug("Processing multipart/form-data request for %s with model %s", param_name, model.__name__)
 
-        has_file_fields = check_for_file_fields(model)
+        file_field_names = get_file_field_names(model)
 
-        if has_file_fields and (request.files or request.form):
+        if file_field_names and (request.files or request.form):
             result = process_file_upload_model(request, model)
             if result:
                 kwargs[param_name] = result
@@ -187,12 +195,7 @@ class MultipartFormDataStrategy(ContentTypeStrategy):
                 message=f"Failed to process file upload for {model.__name__}",
                 details={
                     "model": model.__name__,
-                    "fields": [
-                        f
-                        for f in model.model_fields
-                        if hasattr(model.model_fields[f].annotation, "__origin__")
-                        and model.model_fields[f].annotation.__origin__ is FileField
-                    ],
+                    "fields": list(file_field_names),
                 },
             )
             return make_response(*error_response)
@@ -208,12 +211,12 @@ class MultipartFormDataStrategy(ContentTypeStrategy):
                     kwargs[param_name] = model_instance
                     return kwargs
             except ValidationError as e:
-                logger.warning(f"Validation error for {model.__name__}: {e}")
+                logger.warning("Validation error for %s: %s", model.__name__, e)
 
                 error_response = handle_validation_error(e)
                 return make_response(*error_response)
             except Exception as e:
-                logger.exception(f"Failed to process form data for {model.__name__}")
+                logger.exception("Failed to process form data for %s", model.__name__)
 
                 error_response = handle_request_validation_error(model.__name__, e)
                 return make_response(*error_response)
@@ -229,12 +232,12 @@ class MultipartFormDataStrategy(ContentTypeStrategy):
                     model_instance = model(**model_data)
                     kwargs[param_name] = model_instance
                 except ValidationError as e:
-                    logger.warning(f"Validation error for {model.__name__} with mock files: {e}")
+                    logger.warning("Validation error for %s with mock files: %s", model.__name__, e)
 
                     error_response = handle_validation_error(e)
                     return make_response(*error_response)
                 except Exception as e:
-                    logger.exception(f"Failed to create model instance with mock files for {model.__name__}")
+                    logger.exception("Failed to create model instance with mock files for %s", model.__name__)
 
                     error_response = handle_request_validation_error(model.__name__, e)
                     return make_response(*error_response)
@@ -245,7 +248,7 @@ class MultipartFormDataStrategy(ContentTypeStrategy):
             model_instance = model()
             kwargs[param_name] = model_instance
         except Exception as e:
-            logger.exception(f"Failed to create empty model instance for {model.__name__}")
+            logger.exception("Failed to create empty model instance for %s", model.__name__)
 
             error_response = create_error_response(
                 error_code="MODEL_CREATION_ERROR",
@@ -321,19 +324,18 @@ class BinaryContentTypeStrategy(ContentTypeStrategy):
             Dict[str, Any]: Updated kwargs dictionary with the model instance.
 
         """
-        logger = get_logger(__name__)
-        logger.debug(f"Processing binary request for {param_name} with model {model.__name__}")
+        logger.debug("Processing binary request for %s with model %s", param_name, model.__name__)
 
         try:
             content_length = request.content_length or 0
-            logger.debug(f"Binary content length: {content_length} bytes")
+            logger.debug("Binary content length: %s bytes", content_length)
 
             if content_length > self.max_memory_size:
                 return self._process_large_binary_file(request, model, param_name, kwargs)
             return self._process_small_binary_file(request, model, param_name, kwargs)
 
         except Exception as e:
-            logger.exception(f"Failed to process binary content for {model.__name__}")
+            logger.exception("Failed to process binary content for %s", model.__name__)
 
             error_response = create_error_response(
                 error_code="BINARY_PROCESSING_ERROR",
@@ -358,8 +360,6 @@ class BinaryContentTypeStrategy(ContentTypeStrategy):
             Dict[str, Any]: Updated kwargs dictionary with the model instance.
 
         """
-        logger = get_logger(__name__)
-
         file_name = self._extract_filename(request)
         content_type = request.content_type or "application/octet-stream"
 
@@ -378,11 +378,11 @@ class BinaryContentTypeStrategy(ContentTypeStrategy):
                 model_instance = ModelFactory.create_from_data(model, processed_data)
                 kwargs[param_name] = model_instance
             except ValidationError as e:
-                logger.warning(f"Validation error for binary data against {model.__name__}: {e}")
+                logger.warning("Validation error for binary data against %s: %s", model.__name__, e)
                 error_response = handle_validation_error(e)
                 return make_response(*error_response)
             except Exception as e:
-                logger.exception(f"Failed to create model instance from binary data for {model.__name__}")
+                logger.exception("Failed to create model instance from binary data for %s", model.__name__)
                 error_response = handle_request_validation_error(model.__name__, e)
                 return make_response(*error_response)
             else:
@@ -420,7 +420,6 @@ class BinaryContentTypeStrategy(ContentTypeStrategy):
             Dict[str, Any]: Updated kwargs dictionary with the model instance.
 
         """
-        logger = get_logger(__name__)
         logger.debug("Processing large binary file using streaming")
 
         file_name = self._extract_filename(request)
@@ -456,12 +455,12 @@ class BinaryContentTypeStrategy(ContentTypeStrategy):
                         model_instance._temp_file_path = temp_path
                         kwargs[param_name] = model_instance
                     except ValidationError as e:
-                        logger.warning(f"Validation error for binary data against {model.__name__}: {e}")
+                        logger.warning("Validation error for binary data against %s: %s", model.__name__, e)
                         self._cleanup_temp_file(temp_path)
                         error_response = handle_validation_error(e)
                         return make_response(*error_response)
                     except Exception as e:
-                        logger.exception(f"Failed to create model instance from binary data for {model.__name__}")
+                        logger.exception("Failed to create model instance from binary data for %s", model.__name__)
                         self._cleanup_temp_file(temp_path)
                         error_response = handle_request_validation_error(model.__name__, e)
                         return make_response(*error_response)
@@ -542,8 +541,7 @@ class BinaryContentTypeStrategy(ContentTypeStrategy):
             if file_path_obj.exists():
                 file_path_obj.unlink()
         except Exception:
-            logger = get_logger(__name__)
-            logger.exception(f"Failed to clean up temporary file: {file_path}")
+            logger.exception("Failed to clean up temporary file: %s", file_path)
 
 
 class MultipartMixedStrategy(ContentTypeStrategy):
@@ -600,12 +598,11 @@ class MultipartMixedStrategy(ContentTypeStrategy):
             Dict[str, Any]: Updated kwargs dictionary with the model instance.
 
         """
-        logger = get_logger(__name__)
-        logger.debug(f"Processing multipart/mixed request for {param_name} with model {model.__name__}")
+        logger.debug("Processing multipart/mixed request for %s with model %s", param_name, model.__name__)
 
         try:
             content_length = request.content_length or 0
-            logger.debug(f"Multipart content length: {content_length} bytes")
+            logger.debug("Multipart content length: %s bytes", content_length)
 
             if "boundary=" not in request.content_type:
                 logger.warning("No boundary found in multipart/mixed content type")
@@ -624,7 +621,7 @@ class MultipartMixedStrategy(ContentTypeStrategy):
             return self._process_small_multipart_request(request, model, param_name, kwargs, boundary)
 
         except Exception as e:
-            logger.exception(f"Failed to process multipart/mixed content for {model.__name__}")
+            logger.exception("Failed to process multipart/mixed content for %s", model.__name__)
             error_response = create_error_response(
                 error_code="MULTIPART_PROCESSING_ERROR",
                 message=f"Failed to process multipart/mixed content for {model.__name__}",
@@ -649,8 +646,6 @@ class MultipartMixedStrategy(ContentTypeStrategy):
             Dict[str, Any]: Updated kwargs dictionary with the model instance.
 
         """
-        logger = get_logger(__name__)
-
         try:
             raw_data = request.get_data()
             parts = raw_data.decode("latin1").split(f"--{boundary}")
@@ -659,7 +654,7 @@ class MultipartMixedStrategy(ContentTypeStrategy):
 
             if parsed_parts:
                 return self._create_model_from_parts(parsed_parts, model, param_name, kwargs)
-            logger.warning(f"No valid parts found in multipart/mixed request for {model.__name__}")
+            logger.warning("No valid parts found in multipart/mixed request for %s", model.__name__)
             error_response = create_error_response(
                 error_code="EMPTY_MULTIPART_REQUEST",
                 message="No valid parts found in multipart/mixed request",
@@ -669,7 +664,7 @@ class MultipartMixedStrategy(ContentTypeStrategy):
             return make_response(*error_response)
 
         except Exception as e:
-            logger.exception(f"Failed to process small multipart/mixed content for {model.__name__}")
+            logger.exception("Failed to process small multipart/mixed content for %s", model.__name__)
             error_response = create_error_response(
                 error_code="MULTIPART_PROCESSING_ERROR",
                 message=f"Failed to process multipart/mixed content for {model.__name__}",
@@ -694,7 +689,6 @@ class MultipartMixedStrategy(ContentTypeStrategy):
             Dict[str, Any]: Updated kwargs dictionary with the model instance.
 
         """
-        logger = get_logger(__name__)
         logger.debug("Processing large multipart/mixed file using streaming")
 
         try:
@@ -802,16 +796,16 @@ class MultipartMixedStrategy(ContentTypeStrategy):
                 try:
                     Path.unlink(file_path)
                 except Exception:
-                    logger.exception(f"Failed to clean up temporary file: {file_path}")
+                    logger.exception("Failed to clean up temporary file: %s", file_path)
 
             try:
                 Path.rmdir(temp_dir)
             except Exception:
-                logger.exception(f"Failed to clean up temporary directory: {temp_dir}")
+                logger.exception("Failed to clean up temporary directory: %s", temp_dir)
 
             if parsed_parts:
                 return self._create_model_from_parts(parsed_parts, model, param_name, kwargs)
-            logger.warning(f"No valid parts found in multipart/mixed request for {model.__name__}")
+            logger.warning("No valid parts found in multipart/mixed request for %s", model.__name__)
             error_response = create_error_response(
                 error_code="EMPTY_MULTIPART_REQUEST",
                 message="No valid parts found in multipart/mixed request",
@@ -821,7 +815,7 @@ class MultipartMixedStrategy(ContentTypeStrategy):
             return make_response(*error_response)
 
         except Exception as e:
-            logger.exception(f"Failed to process large multipart/mixed content for {model.__name__}")
+            logger.exception("Failed to process large multipart/mixed content for %s", model.__name__)
             error_response = create_error_response(
                 error_code="MULTIPART_PROCESSING_ERROR",
                 message=f"Failed to process multipart/mixed content for {model.__name__}",
@@ -841,7 +835,6 @@ class MultipartMixedStrategy(ContentTypeStrategy):
             dict[str, Any]: Dictionary of parsed parts.
 
         """
-        logger = get_logger(__name__)
         parsed_parts = {}
 
         for part in parts:
@@ -872,7 +865,7 @@ class MultipartMixedStrategy(ContentTypeStrategy):
                         else:
                             parsed_parts["json"] = value
                     except json.JSONDecodeError as e:
-                        logger.warning(f"Failed to parse JSON content in multipart/mixed: {e}")
+                        logger.warning("Failed to parse JSON content in multipart/mixed: %s", e)
                         if field_name:
                             parsed_parts[field_name] = content
                         else:
@@ -917,8 +910,6 @@ class MultipartMixedStrategy(ContentTypeStrategy):
             Dict[str, Any]: Updated kwargs dictionary with the model instance.
 
         """
-        logger = get_logger(__name__)
-
         try:
             if hasattr(model, "model_fields"):
                 model_data = {}
@@ -932,7 +923,7 @@ class MultipartMixedStrategy(ContentTypeStrategy):
                     model_instance = ModelFactory.create_from_data(model, processed_data)
                     kwargs[param_name] = model_instance
                 except ValidationError as e:
-                    logger.warning(f"Validation error for multipart/mixed data against {model.__name__}: {e}")
+                    logger.warning("Validation error for multipart/mixed data against %s: %s", model.__name__, e)
                     error_response = handle_validation_error(e)
                     return make_response(*error_response)
                 else:
@@ -945,7 +936,7 @@ class MultipartMixedStrategy(ContentTypeStrategy):
 
             kwargs[param_name] = model_instance
         except Exception as e:
-            logger.exception(f"Failed to create model instance from multipart/mixed data for {model.__name__}")
+            logger.exception("Failed to create model instance from multipart/mixed data for %s", model.__name__)
             error_response = handle_request_validation_error(model.__name__, e)
             return make_response(*error_response)
         else:
@@ -987,8 +978,7 @@ class FormUrlencodedStrategy(ContentTypeStrategy):
             Dict[str, Any]: Updated kwargs dictionary with the model instance.
 
         """
-        logger = get_logger(__name__)
-        logger.debug(f"Processing form-urlencoded request for {param_name} with model {model.__name__}")
+        logger.debug("Processing form-urlencoded request for %s with model %s", param_name, model.__name__)
 
         form_data = self._extract_form_data(request)
 
@@ -998,7 +988,7 @@ class FormUrlencodedStrategy(ContentTypeStrategy):
             model_instance = model()
             kwargs[param_name] = model_instance
         except Exception as e:
-            logger.exception(f"Failed to create empty model instance for {model.__name__}")
+            logger.exception("Failed to create empty model instance for %s", model.__name__)
 
             error_response = create_status_error_response(
                 status_code=400,
@@ -1019,8 +1009,6 @@ class FormUrlencodedStrategy(ContentTypeStrategy):
             dict[str, Any]: Dictionary of form data.
 
         """
-        logger = get_logger(__name__)
-
         if hasattr(request, "form") and request.form:
             return dict(request.form.items())
 
@@ -1061,8 +1049,6 @@ class FormUrlencodedStrategy(ContentTypeStrategy):
             Dict[str, Any]: Updated kwargs dictionary with the model instance.
 
         """
-        logger = get_logger(__name__)
-
         try:
             processed_form_data = {}
             for key, value in form_data.items():
@@ -1083,14 +1069,14 @@ class FormUrlencodedStrategy(ContentTypeStrategy):
                 model_instance = ModelFactory.create_from_data(model, processed_data)
                 kwargs[param_name] = model_instance
             except ValidationError as e:
-                logger.warning(f"Validation error for form data against {model.__name__}: {e}")
+                logger.warning("Validation error for form data against %s: %s", model.__name__, e)
                 error_response = handle_validation_error(e)
                 return make_response(*error_response)
             else:
                 return kwargs
 
         except Exception as e:
-            logger.exception(f"Failed to process form data for {model.__name__}")
+            logger.exception("Failed to process form data for %s", model.__name__)
             error_response = handle_request_validation_error(model.__name__, e)
             return make_response(*error_response)
 
@@ -1129,19 +1115,18 @@ class DefaultStrategy(ContentTypeStrategy):
             Dict[str, Any]: Updated kwargs dictionary with the model instance.
 
         """
-        logger = get_logger(__name__)
-        logger.debug(f"Using default strategy for {param_name} with model {model.__name__}")
+        logger.debug("Using default strategy for %s with model %s", param_name, model.__name__)
 
         try:
             model_instance = model()
             kwargs[param_name] = model_instance
         except ValidationError as e:
-            logger.warning(f"Validation error creating default instance of {model.__name__}: {e}")
+            logger.warning("Validation error creating default instance of %s: %s", model.__name__, e)
 
             error_response = handle_validation_error(e)
             return make_response(*error_response)
         except Exception as e:
-            logger.exception(f"Failed to create empty model instance for {model.__name__}")
+            logger.exception("Failed to create empty model instance for %s", model.__name__)
 
             error_response = create_status_error_response(
                 status_code=500,
@@ -1163,6 +1148,7 @@ class ContentTypeRegistry:
     Attributes:
         _strategies: Dictionary mapping strategy classes to their instances.
         _default_strategy: Default strategy to use when no matching strategy is found.
+        _resolved: Strategies already resolved for a base media type (parameters stripped).
 
     """
 
@@ -1174,6 +1160,7 @@ class ContentTypeRegistry:
             cls._instance = super().__new__(cls)
             cls._instance._strategies = {}
             cls._instance._default_strategy = None
+            cls._instance._resolved = {}
         return cls._instance
 
     def register(self, strategy_class: type[ContentTypeStrategy], is_default: bool = False) -> None:
@@ -1188,6 +1175,13 @@ class ContentTypeRegistry:
         self._strategies[strategy_class] = strategy_instance
         if is_default:
             self._default_strategy = strategy_instance
+        self._resolved.clear()
+
+    def reset(self) -> None:
+        """Remove all registered strategies, including the default strategy."""
+        self._strategies = {}
+        self._default_strategy = None
+        self._resolved = {}
 
     def get_strategy_for_content_type(self, content_type: str) -> ContentTypeStrategy:
         """Get the appropriate strategy for a given content type.
@@ -1199,15 +1193,29 @@ class ContentTypeRegistry:
             ContentTypeStrategy: The appropriate strategy for the content type.
 
         """
-        for strategy in self._strategies.values():
-            if strategy.can_handle(content_type):
-                return strategy
+        # Parameters such as the multipart boundary differ per request, so resolve on the media type alone
+        media_type = content_type.partition(";")[0].strip().lower()
+
+        strategy = self._resolved.get(media_type)
+        if strategy is not None:
+            return strategy
+
+        for candidate in self._strategies.values():
+            if candidate.can_handle(media_type):
+                strategy = candidate
+                break
+        else:
+            strategy = self._default_strategy
 
-        if self._default_strategy:
-            return self._default_strategy
+        if strategy is None:
+            msg = f"No strategy found for content type: {content_type}"
+            raise ValueError(msg)
 
-        msg = f"No strategy found for content type: {content_type}"
-        raise ValueError(msg)
+        # Content types come from request headers, so keep the memo bounded
+        if len(self._resolved) >= MAX_RESOLVED_CONTENT_TYPES:
+            self._resolved.clear()
+        self._resolved[media_type] = strategy
+        return strategy
 
     def get_all_strategies(self) -> list[ContentTypeStrategy]:
         """Get all registered strategies.
@@ -1285,11 +1293,10 @@ class ContentTypeProcessor:
             Dict[str, Any]: Updated kwargs dictionary with the model instance.
 
         """
-        logger = get_logger(__name__)
-        logger.debug(f"Processing request body for {param_name} with model {model.__name__}")
+        logger.debug("Processing request body for %s with model %s", param_name, model.__name__)
 
         actual_content_type = request.content_type or ""
-        logger.debug(f"Actual request content type: {actual_content_type}")
+        logger.debug("Actual request content type: %s", actual_content_type)
 
         effective_content_type = self._resolve_content_type(request, actual_content_type)
 
@@ -1297,24 +1304,24 @@ class ContentTypeProcessor:
 
         if mapped_model:
             model = mapped_model
-            logger.debug(f"Using mapped model: {model.__name__}")
+            logger.debug("Using mapped model: %s", model.__name__)
 
         try:
             strategy = self.registry.get_strategy_for_content_type(effective_content_type)
-            logger.debug(f"Using strategy {strategy.__class__.__name__} for content type {effective_content_type}")
+            logger.debug("Using strategy %s for content type %s", strategy.__class__.__name__, effective_content_type)
 
             if hasattr(strategy, "set_max_memory_size"):
                 strategy.set_max_memory_size(self.max_memory_size)
 
             return strategy.process_request(request, model, param_name, kwargs)
         except Exception as e:
-            logger.exception(f"Error processing request with content type {effective_content_type}")
+            logger.exception("Error processing request with content type %s", effective_content_type)
 
             try:
                 model_instance = model()
                 kwargs[param_name] = model_instance
             except Exception:
-                logger.exception(f"Failed to create empty model instance for {model.__name__}")
+                logger.exception("Failed to create empty model instance for %s", model.__name__)
 
                 error_response = create_status_error_response(
                     status_code=400,
@@ -1336,14 +1343,13 @@ class ContentTypeProcessor:
             str: The resolved content type.
 
         """
-        logger = get_logger(__name__)
         effective_content_type = self.content_type or actual_content_type
 
         if self.content_type_resolver and hasattr(request, "args"):
             try:
                 resolved_content_type = self.content_type_resolver(request)
                 if resolved_content_type:
-                    logger.debug(f"Resolved content type using custom resolver: {resolved_content_type}")
+                    logger.debug("Resolved content type using custom resolver: %s", resolved_content_type)
                     effective_content_type = resolved_content_type
             except Exception:
                 logger.exception("Error resolving content type with custom resolver")
@@ -1351,7 +1357,7 @@ class ContentTypeProcessor:
         if self.request_content_types and isinstance(self.request_content_types, RequestContentTypes):
             if self.request_content_types.default_content_type:
                 default_type = self.request_content_types.default_content_type
-                logger.debug(f"Using default content type from RequestContentTypes: {default_type}")
+                logger.debug("Using default content type from RequestContentTypes: %s", default_type)
                 effective_content_type = default_type
 
             if self.request_content_types.content_type_resolver and hasattr(request, "args"):
@@ -1359,7 +1365,7 @@ class ContentTypeProcessor:
                     resolved_content_type = self.request_content_types.content_type_resolver(request)
                     if resolved_content_type:
                         logger.debug(
-                            f"Resolved content type using RequestContentTypes resolver: {resolved_content_type}"
+                            "Resolved content type using RequestContentTypes resolver: %s", resolved_content_type
                         )
                         effective_content_type = resolved_content_type
                 except Exception:
@@ -1367,10 +1373,10 @@ class ContentTypeProcessor:
 
         if hasattr(request, "args") and "content_type" in request.args:
             url_content_type = request.args.get("content_type")
-            logger.debug(f"Found content type in URL parameters: {url_content_type}")
+            logger.debug("Found content type in URL parameters: %s", url_content_type)
             effective_content_type = url_content_type
 
-        logger.debug(f"Resolved effective content type: {effective_content_type}")
+        logger.debug("Resolved effective content type: %s", effective_content_type)
         return effective_content_type
 
     def _resolve_model_for_content_type(
@@ -1387,7 +1393,6 @@ class ContentTypeProcessor:
             Optional[type[BaseModel]]: The model to use, or None if no mapping is found.
 
         """
-        logger = get_logger(__name__)
         mapped_model = None
 
         if not self.request_content_types:
@@ -1399,7 +1404,7 @@ class ContentTypeProcessor:
         for content_type, content_model in self.request_content_types.content_types.items():
             if content_type in actual_content_type:
                 if isinstance(content_model, type) and issubclass(content_model, BaseModel):
-                    logger.debug(f"Found matching model for content type {content_type}: {content_model.__name__}")
+                    logger.debug("Found matching model for content type %s: %s", content_type, content_model.__name__)
                     mapped_model = content_model
                     break
 
@@ -1410,38 +1415,66 @@ class ContentTypeProcessor:
         ):
             content_model = self.request_content_types.content_types[effective_content_type]
             if isinstance(content_model, type) and issubclass(content_model, BaseModel):
-                logger.debug(f"Using mapped model for content type {effective_content_type}: {content_model.__name__}")
+                logger.debug(
+                    "Using mapped model for content type %s: %s", effective_content_type, content_model.__name__
+                )
                 mapped_model = content_model
 
         return mapped_model
 
 
-def check_for_file_fields(model: type[BaseModel]) -> bool:
-    """Check if a model contains file upload fields.
+def _is_file_annotation(annotation: Any) -> bool:
+    """Check if a field annotation is FileField or list[FileField]."""
+    if isinstance(annotation, type) and issubclass(annotation, FileField):
+        return True
+
+    if getattr(annotation, "__origin__", None) is list:
+        args = getattr(annotation, "__args__", ())
+        return bool(args) and isinstance(args[0], type) and issubclass(args[0], FileField)
+
+    return False
+
+
+def get_file_field_names(model: Any) -> tuple[str, ...]:
+    """Get the names of the file upload fields of a Pydantic model.
+
+    The fields are detected once per model class and cached, so request handlers
+    can check for file uploads without walking the model fields on every request.
 
     Args:
-        model: The model to check.
+        model: The model class to inspect.
 
     Returns:
-        bool: True if the model has file fields, False otherwise.
+        tuple[str, ...]: Names of the fields annotated as FileField or list[FileField],
+            in definition order. Empty if the model has no file fields or is not a Pydantic model class.
 
     """
-    if not hasattr(model, "model_fields"):
-        return False
+    if not (isinstance(model, type) and issubclass(model, BaseModel)):
+        return ()
+
+    file_fields = FILE_FIELDS_CACHE.get(model)
+    if file_fields is None:
+        file_fields = tuple(
+            field_name
+            for field_name, field_info in model.model_fields.items()
+            if _is_file_annotation(field_info.annotation)
+        )
+        FILE_FIELDS_CACHE[model] = file_fields
 
-    for field_info in model.model_fields.values():
-        field_type = field_info.annotation
+    return file_fields
 
-        if isinstance(field_type, type) and issubclass(field_type, FileField):
-            return True
 
-        origin = getattr(field_type, "__origin__", None)
-        if origin is list or origin is list:
-            args = getattr(field_type, "__args__", [])
-            if args and isinstance(args[0], type) and issubclass(args[0], FileField):
-                return True
+def check_for_file_fields(model: type[BaseModel]) -> bool:
+    """Check if a model contains file upload fields.
 
-    return False
+    Args:
+        model: The model to check.
+
+    Returns:
+        bool: True if the model has file fields, False otherwise.
+
+    """
+    return bool(get_file_field_names(model))
 
 
 def process_file_upload_model(request: Any, model: type[BaseModel]) -> BaseModel | None:
@@ -1455,29 +1488,12 @@ def process_file_upload_model(request: Any, model: type[BaseModel]) -> BaseModel
         Optional[BaseModel]: An instance of the model with file data, or None if processing failed.
 
     """
-    logger = get_logger(__name__)
-    logger.debug(f"Processing file upload model for {model.__name__}")
+    logger.debug("Processing file upload model for %s", model.__name__)
 
     model_data = dict(request.form.items())
-    logger.debug(f"Form data: {model_data}")
-
-    has_file_fields = False
-    file_field_names = []
-
-    for field_name, field_info in model.model_fields.items():
-        field_type = field_info.annotation
-
-        if isinstance(field_type, type) and issubclass(field_type, FileField):
-            has_file_fields = True
-            file_field_names.append(field_name)
-            continue
+    logger.debug("Form data: %s", model_data)
 
-        origin = getattr(field_type, "__origin__", None)
-        if origin is list or origin is list:
-            args = getattr(field_type, "__args__", [])
-            if args and isinstance(args[0], type) and issubclass(args[0], FileField):
-                has_file_fields = True
-                file_field_names.append(field_name)
+    file_field_names = get_file_field_names(model)
 
     files_found = False
 
@@ -1488,20 +1504,20 @@ def process_file_upload_model(request: Any, model: type[BaseModel]) -> BaseModel
             if field_name in request.files:
                 model_data[field_name] = request.files[field_name]
                 files_found = True
-                logger.debug(f"Found file for field {field_name}: {request.files[field_name].filename}")
+                logger.debug("Found file for field %s: %s", field_name, request.files[field_name].filename)
             elif "file" in request.files and field_name == "file":
                 model_data[field_name] = request.files["file"]
                 files_found = True
-                logger.debug(f"Using default file for field {field_name}: {request.files['file'].filename}")
+                logger.debug("Using default file for field %s: %s", field_name, request.files["file"].filename)
             elif "avatar" in request.files and field_name == "avatar":
                 model_data[field_name] = request.files["avatar"]
                 files_found = True
-                logger.debug(f"Using avatar file for field {field_name}: {request.files['avatar'].filename}")
+                logger.debug("Using avatar file for field %s: %s", field_name, request.files["avatar"].filename)
             elif len(request.files) == 1:
                 file_key = next(iter(request.files))
                 model_data[field_name] = request.files[file_key]
                 files_found = True
-                logger.debug(f"Using single file for field {field_name}: {request.files[file_key].filename}")
+                logger.debug("Using single file for field %s: %s", field_name, request.files[file_key].filename)
 
         else:
             origin = getattr(field_type, "__origin__", None)
@@ -1514,7 +1530,7 @@ def process_file_upload_model(request: Any, model: type[BaseModel]) -> BaseModel
                             if files_list:
                                 model_data[field_name] = files_list
                                 files_found = True
-                                logger.debug(f"Found multiple files for field {field_name}: {len(files_list)} files")
+                                logger.debug("Found multiple files for field %s: %s files", field_name, len(files_list))
                     else:
                         all_files = []
                         for file_key in request.files:
@@ -1526,19 +1542,19 @@ def process_file_upload_model(request: Any, model: type[BaseModel]) -> BaseModel
                         if all_files:
                             model_data[field_name] = all_files
                             files_found = True
-                            logger.debug(f"Collected all files for field {field_name}: {len(all_files)} files")
+                            logger.debug("Collected all files for field %s: %s files", field_name, len(all_files))
 
-    if has_file_fields and not files_found:
-        logger.warning(f"No files found for file fields: {file_field_names}")
+    if file_field_names and not files_found:
+        logger.warning("No files found for file fields: %s", list(file_field_names))
         return None
 
     processed_data = preprocess_request_data(model_data, model)
-    logger.debug(f"Processed data: {processed_data}")
+    logger.debug("Processed data: %s", processed_data)
 
     try:
         return ModelFactory.create_from_data(model, processed_data)
     except ValidationError:
-        logger.warning(f"Validation error for file upload model {model.__name__}")
+        logger.warning("Validation error for file upload model %s", model.__name__)
         return None
     except Exception:
         logger.exception("Error creating model instance")
@@ -30,7 +30,6 @@ from pydantic import BaseModel
 from flask_x_openapi_schema.core.content_type_utils import (
     ContentTypeProcessor,
 )
-from flask_x_openapi_schema.core.logger import get_logger
 from flask_x_openapi_schema.models.content_types import (
     RequestContentTypes,
     ResponseContentTypes,
@@ -48,6 +47,7 @@ from flask_x_openapi_schema.models.responses import OpenAPIMetaResponse
 
 from .cache import (
     FUNCTION_METADATA_CACHE,
+    extract_param_types,
     get_parameter_prefixes,
 )
 from .config import GLOBAL_CONFIG_HOLDER, ConventionalPrefixConfig
@@ -100,10 +100,8 @@ def _extract_parameters_from_prefixes(
         ['id']
 
     """
-    logger = get_logger(__name__)
-
     prefixes = get_parameter_prefixes(config)
-    logger.debug(f"Extracting parameters with prefixes={prefixes}, signature={signature}, type_hints={type_hints}")
+    logger.debug("Extracting parameters with prefixes=%s, signature=%s, type_hints=%s", prefixes, signature, type_hints)
 
     request_body = None
     query_model = None
@@ -139,7 +137,7 @@ def _extract_parameters_from_prefixes(
     result = (request_body, query_model, path_params)
 
     logger.debug(
-        f"Extracted parameters: request_body={request_body}, query_model={query_model}, path_params={path_params}",
+        "Extracted parameters: request_body=%s, query_model=%s, path_params=%s", request_body, query_model, path_params
     )
 
     return result
@@ -241,10 +239,7 @@ def _generate_openapi_metadata(
         True
 
     """
-    import logging
-
-    logger = logging.getLogger(__name__)
-    logger.debug(f"Generating OpenAPI metadata with request_body={actual_request_body}")
+    logger.debug("Generating OpenAPI metadata with request_body=%s", actual_request_body)
     metadata: dict[str, Any] = {}
 
     current_lang = language or get_current_language()
@@ -267,11 +262,11 @@ def _generate_openapi_metadata(
 
     if request_content_types is not None:
         metadata["requestBody"] = request_content_types.to_openapi_dict()
-        logger.debug(f"Added requestBody with multiple content types: {metadata['requestBody']}")
+        logger.debug("Added requestBody with multiple content types: %s", metadata["requestBody"])
     elif actual_request_body:
-        logger.debug(f"Processing request body: {actual_request_body}")
+        logger.debug("Processing request body: %s", actual_request_body)
         if isinstance(actual_request_body, type) and issubclass(actual_request_body, BaseModel):
-            logger.debug(f"Request body is a Pydantic model: {actual_request_body.__name__}")
+            logger.debug("Request body is a Pydantic model: %s", actual_request_body.__name__)
 
             if content_type is None:
                 detected_content_type = detect_content_type_from_model(actual_request_body)
@@ -279,7 +274,7 @@ def _generate_openapi_metadata(
             else:
                 final_content_type = content_type
 
-            logger.debug(f"Using content type: {final_content_type} (custom: {content_type is not None})")
+            logger.debug("Using content type: %s (custom: %s)", final_content_type, content_type is not None)
 
             metadata["requestBody"] = {
                 "content": {
@@ -287,9 +282,9 @@ def _generate_openapi_metadata(
                 },
                 "required": True,
             }
-            logger.debug(f"Added requestBody to metadata: {metadata['requestBody']}")
+            logger.debug("Added requestBody to metadata: %s", metadata["requestBody"])
         else:
-            logger.debug(f"Request body is a dict: {actual_request_body}")
+            logger.debug("Request body is a dict: %s", actual_request_body)
             metadata["requestBody"] = actual_request_body
 
     if response_content_types is not None:
@@ -305,7 +300,7 @@ def _generate_openapi_metadata(
                     "content": response_content_types.to_openapi_dict(),
                 }
             }
-        logger.debug(f"Added responses with multiple content types: {metadata['responses']}")
+        logger.debug("Added responses with multiple content types: %s", metadata["responses"])
     elif responses:
         metadata["responses"] = responses.to_openapi_dict()
 
@@ -769,8 +764,8 @@ class OpenAPIDecoratorBase:
             A wrapper function that reuses cached metadata
 
         """
-        logger.debug(f"Using cached metadata for function {func.__name__}")
-        logger.debug(f"Cached metadata: {cached_data['metadata']}")
+        logger.debug("Using cached metadata for function %s", func.__name__)
+        logger.debug("Cached metadata: %s", cached_data["metadata"])
 
         @wraps(func)
         def cached_wrapper(*args, **kwargs) -> Any:
@@ -811,41 +806,8 @@ class OpenAPIDecoratorBase:
             self.prefix_config,
         )
 
-    def _generate_metadata_cache_key(
-        self,
-        actual_request_body: type[BaseModel] | dict[str, Any] | None,
-        actual_query_model: type[BaseModel] | None,
-        actual_path_params: list[str],
-    ) -> tuple:
-        """Generate a cache key for metadata.
-
-        Args:
-            actual_request_body: Request body model or dict
-            actual_query_model: Query parameters model
-            actual_path_params: Path parameters
-
-        Returns:
-            A cache key for metadata
-
-        """
-        return (
-            str(self.summary),
-            str(self.description),
-            str(self.tags) if self.tags else None,
-            self.operation_id,
-            self.deprecated,
-            str(self.security) if self.security else None,
-            str(self.external_docs) if self.external_docs else None,
-            id(actual_request_body) if isinstance(actual_request_body, type) else str(actual_request_body),
-            str(self.responses) if self.responses else None,
-            id(actual_query_model) if actual_query_model else None,
-            str(actual_path_params) if actual_path_params else None,
-            self.language,
-        )
-
     def _get_or_generate_metadata(
         self,
-        cache_key: tuple,  # noqa: ARG002
         actual_request_body: type[BaseModel] | dict[str, Any] | None,
     ) -> dict[str, Any]:
         """Generate OpenAPI metadata for an endpoint.
@@ -854,7 +816,6 @@ class OpenAPIDecoratorBase:
         using the decorator's attributes.
 
         Args:
-            cache_key: Cache key for metadata (not used now).
             actual_request_body: Request body model or dict.
 
         Returns:
@@ -905,7 +866,7 @@ class OpenAPIDecoratorBase:
         if actual_query_model or actual_path_params:
             model_parameters = self._get_or_generate_model_parameters(actual_query_model, actual_path_params)
             if model_parameters:
-                logger.debug(f"Added parameters to metadata: {model_parameters}")
+                logger.debug("Added parameters to metadata: %s", model_parameters)
                 openapi_parameters.extend(model_parameters)
 
         file_params = _detect_file_parameters(param_names, func_annotations, self.prefix_config)
@@ -1037,8 +998,8 @@ class OpenAPIDecoratorBase:
         """
         self._initialize_framework_decorator()
 
-        if func in FUNCTION_METADATA_CACHE:
-            cached_data = FUNCTION_METADATA_CACHE[func]
+        cached_data = FUNCTION_METADATA_CACHE.get(func)
+        if cached_data is not None:
             return self._create_cached_wrapper(func, cached_data)
 
         signature = inspect.signature(func)
@@ -1049,12 +1010,13 @@ class OpenAPIDecoratorBase:
         actual_request_body, actual_query_model, actual_path_params = self._extract_parameters(signature, type_hints)
 
         logger.debug(
-            f"Generating metadata with request_body={actual_request_body}, query_model={actual_query_model}, path_params={actual_path_params}",
+            "Generating metadata with request_body=%s, query_model=%s, path_params=%s",
+            actual_request_body,
+            actual_query_model,
+            actual_path_params,
         )
 
-        cache_key = self._generate_metadata_cache_key(actual_request_body, actual_query_model, actual_path_params)
-
-        metadata = self._get_or_generate_metadata(cache_key, actual_request_body)
+        metadata = self._get_or_generate_metadata(actual_request_body)
 
         func_annotations = get_type_hints(func)
         openapi_parameters = self._generate_openapi_parameters(
@@ -1069,22 +1031,7 @@ class OpenAPIDecoratorBase:
 
         func._openapi_metadata = metadata
 
-        param_types = {}
-
-        if (
-            actual_request_body
-            and isinstance(actual_request_body, type)
-            and issubclass(actual_request_body, BaseModel)
-            and hasattr(actual_request_body, "model_fields")
-        ):
-            param_types.update(
-                {field_name: field.annotation for field_name, field in actual_request_body.model_fields.items()}
-            )
-
-        if actual_query_model and hasattr(actual_query_model, "model_fields"):
-            param_types.update(
-                {field_name: field.annotation for field_name, field in actual_query_model.model_fields.items()}
-            )
+        param_types = extract_param_types(actual_request_body, actual_query_model)
 
         existing_hints = get_type_hints(func)
         merged_hints = {**existing_hints, **param_types}
@@ -1124,8 +1071,6 @@ class OpenAPIDecoratorBase:
         signature = cached_data["signature"]
         param_names = cached_data.get("param_names", [])
 
-        from flask import request
-
         has_request_context = False
         with contextlib.suppress(RuntimeError):
             has_request_context = bool(request)
@@ -1174,7 +1119,7 @@ class OpenAPIDecoratorBase:
         sig_params = signature.parameters
 
         if not isinstance(kwargs, dict):
-            logger.warning(f"kwargs is not a dict: {type(kwargs)}")
+            logger.warning("kwargs is not a dict: %s", type(kwargs))
             valid_kwargs = {}
         else:
             valid_kwargs = {k: v for k, v in kwargs.items() if k in sig_params}
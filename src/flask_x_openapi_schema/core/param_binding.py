@@ -60,6 +60,7 @@ from typing import Any, TypeVar
 from flask import request
 from pydantic import BaseModel
 
+from flask_x_openapi_schema.core.cache import get_parameter_prefixes
 from flask_x_openapi_schema.core.config import ConventionalPrefixConfig
 
 logger = logging.getLogger(__name__)
@@ -208,8 +209,6 @@ class PathParameterBindingStrategy(ParameterBindingStrategy):
 
         """
         self.prefix_config = prefix_config
-        from flask_x_openapi_schema.core.cache import get_parameter_prefixes
-
         _, _, path_prefix, _ = get_parameter_prefixes(prefix_config)
         self.path_prefix_len = len(path_prefix) + 1
 
@@ -253,8 +252,6 @@ class FileParameterBindingStrategy(ParameterBindingStrategy):
         """
         self.prefix_config = prefix_config
         self.type_hints = type_hints or {}
-        from flask_x_openapi_schema.core.cache import get_parameter_prefixes
-
         _, _, _, file_prefix = get_parameter_prefixes(prefix_config)
         self.file_prefix_len = len(file_prefix) + 1
 
@@ -428,8 +425,6 @@ class ParameterProcessor:
         """
         self.prefix_config = prefix_config
         self.framework_decorator = framework_decorator
-        from flask_x_openapi_schema.core.cache import get_parameter_prefixes
-
         self.prefixes = get_parameter_prefixes(prefix_config)
         self.body_prefix, self.query_prefix, self.path_prefix, self.file_prefix = self.prefixes
 
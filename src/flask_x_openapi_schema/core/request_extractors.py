@@ -25,6 +25,7 @@ Examples:
 
 import functools
 import json
+import logging
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from typing import Any, TypeVar
@@ -32,11 +33,11 @@ from typing import Any, TypeVar
 from flask import Request
 from pydantic import BaseModel
 
-from flask_x_openapi_schema.core.logger import get_logger
+from flask_x_openapi_schema.core.request_processing import preprocess_request_data
 
 T = TypeVar("T")
 
-logger = get_logger(__name__)
+logger = logging.getLogger(__name__)
 
 
 def log_operation(func: Callable[..., T]) -> Callable[..., T]:
@@ -62,15 +63,16 @@ def log_operation(func: Callable[..., T]) -> Callable[..., T]:
         ```
 
     """
+    logger = logging.getLogger(func.__module__)
+    func_name = func.__name__
 
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> T:
-        logger = get_logger(func.__module__)
-        logger.debug(f"Calling {func.__name__}")
+        logger.debug("Calling %s", func_name)
         try:
             return func(*args, **kwargs)
         except Exception as e:
-            logger.warning(f"Error in {func.__name__}: {e}")
+            logger.warning("Error in %s: %s", func_name, e)
             raise
 
     return wrapper
@@ -105,8 +107,7 @@ def safe_operation(operation: Callable[[], T], fallback: Any = None, log_error:
         return operation()
     except Exception as e:
         if log_error:
-            logger = get_logger(__name__)
-            logger.warning(f"Operation failed: {e}")
+            logger.warning("Operation failed: %s", e)
         return fallback() if callable(fallback) else fallback
 
 
@@ -632,8 +633,6 @@ class RequestProcessor:
             ```
 
         """
-        from flask_x_openapi_schema.core.request_processing import preprocess_request_data
-
         data = self.extract_data(request)
         if not data:
             logger.debug(f"No data extracted for {param_name}")
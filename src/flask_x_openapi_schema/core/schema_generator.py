@@ -15,6 +15,7 @@ from pydantic import BaseModel
 from flask_x_openapi_schema.i18n.i18n_model import I18nBaseModel
 from flask_x_openapi_schema.i18n.i18n_string import I18nStr, get_current_language
 
+from .cache import get_parameter_prefixes
 from .config import get_openapi_config
 from .utils import process_i18n_dict, process_i18n_value, pydantic_to_openapi_schema
 
@@ -75,12 +76,12 @@ class OpenAPISchemaGenerator:
         self._registered_models: set[type[BaseModel]] = set()
 
         # Thread safety locks
-        self._lock = threading.RLock()  # Main lock for coordinating access
-        self._paths_lock = threading.RLock()
-        self._components_lock = threading.RLock()
-        self._tags_lock = threading.RLock()
-        self._models_lock = threading.RLock()
-        self._webhooks_lock = threading.RLock()
+        self._lock = threading.Lock()  # Main lock for coordinating access
+        self._paths_lock = threading.Lock()
+        self._components_lock = threading.Lock()
+        self._tags_lock = threading.Lock()
+        self._models_lock = threading.Lock()
+        self._webhooks_lock = threading.Lock()
 
     def add_security_scheme(self, name: str, scheme: dict[str, Any]) -> None:
         """Add a security scheme to the OpenAPI schema.
@@ -195,8 +196,6 @@ class OpenAPISchemaGenerator:
             The OpenAPI path
 
         """
-        from .cache import get_parameter_prefixes
-
         # Get parameter prefixes from current configuration
         _, _, path_prefix, _ = get_parameter_prefixes()
         path_prefix_len = len(path_prefix) + 1  # +1 for the underscore
@@ -224,8 +223,6 @@ class OpenAPISchemaGenerator:
             A list of OpenAPI parameter objects
 
         """
-        from .cache import get_parameter_prefixes
-
         # Get parameter prefixes from current configuration
         _, _, path_prefix, _ = get_parameter_prefixes()
         path_prefix_len = len(path_prefix) + 1  # +1 for the underscore
@@ -5,19 +5,22 @@ endpoints. The decorators handle parameter binding for request data, including r
 query parameters, path parameters, and file uploads.
 """
 
+import logging
 from collections.abc import Callable
 from typing import Any, TypeVar
 
 from flask import request
 from pydantic import BaseModel
 
-from flask_x_openapi_schema import get_logger
 from flask_x_openapi_schema.core.config import ConventionalPrefixConfig
+from flask_x_openapi_schema.core.content_type_utils import get_file_field_names
 from flask_x_openapi_schema.core.decorator_base import DecoratorBase, OpenAPIDecoratorBase
 from flask_x_openapi_schema.i18n.i18n_string import I18nStr
 from flask_x_openapi_schema.models.content_types import RequestContentTypes, ResponseContentTypes
 from flask_x_openapi_schema.models.responses import OpenAPIMetaResponse
 
+logger = logging.getLogger(__name__)
+
 
 class FlaskOpenAPIDecorator(DecoratorBase):
     """OpenAPI metadata decorator for Flask MethodView.
@@ -168,27 +171,8 @@ class FlaskOpenAPIDecorator(DecoratorBase):
             Updated kwargs dictionary with the model instance
 
         """
-        from flask import request
-
-        from flask_x_openapi_schema.models.file_models import FileField
-
         if hasattr(model, "model_fields") and hasattr(request, "files") and request.files:
-            has_file_fields = False
-            for field_info in model.model_fields.values():
-                field_type = field_info.annotation
-
-                if isinstance(field_type, type) and issubclass(field_type, FileField):
-                    has_file_fields = True
-                    break
-
-                origin = getattr(field_type, "__origin__", None)
-                if origin is list or origin is list:
-                    args = getattr(field_type, "__args__", [])
-                    if args and isinstance(args[0], type) and issubclass(args[0], FileField):
-                        has_file_fields = True
-                        break
-
-            if has_file_fields:
+            if get_file_field_names(model):
                 model_data = dict(request.form.items())
                 for field_name in model.model_fields:
                     if field_name in request.files:
@@ -199,9 +183,8 @@ class FlaskOpenAPIDecorator(DecoratorBase):
                         model_instance = model(**model_data)
                         kwargs[param_name] = model_instance
                     except Exception as e:
-                        logger = get_logger(__name__)
                         logger.exception(
-                            f"Failed to create model instance with mock files for {model.__name__}", exc_info=e
+                            "Failed to create model instance with mock files for %s", model.__name__, exc_info=e
                         )
                     else:
                         return kwargs
@@ -244,9 +227,9 @@ class FlaskOpenAPIDecorator(DecoratorBase):
             Updated kwargs dictionary
 
         """
-        logger = get_logger(__name__)
-        logger.debug(f"Processing additional parameters with kwargs keys: {list(kwargs.keys())}")
-        logger.debug(f"Processed parameter names: {param_names}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Processing additional parameters with kwargs keys: %s", list(kwargs.keys()))
+            logger.debug("Processed parameter names: %s", param_names)
         return kwargs
 
 
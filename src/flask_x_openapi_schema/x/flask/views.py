@@ -32,6 +32,7 @@ from typing import Any, get_type_hints
 from flask.views import MethodView
 from pydantic import BaseModel
 
+from flask_x_openapi_schema.core.cache import get_parameter_prefixes
 from flask_x_openapi_schema.core.schema_generator import OpenAPISchemaGenerator
 
 
@@ -121,8 +122,6 @@ def extract_openapi_parameters_from_methodview(
         list[dict[str, Any]]: List of OpenAPI parameter objects
 
     """
-    from flask_x_openapi_schema.core.cache import get_parameter_prefixes
-
     parameters = []
 
     method_func = getattr(view_class, method.lower(), None)
@@ -247,8 +246,6 @@ class MethodViewOpenAPISchemaGenerator(OpenAPISchemaGenerator):
 
         full_url = (url_prefix + url).replace("//", "/")
 
-        from flask_x_openapi_schema.core.cache import get_parameter_prefixes
-
         _, _, path_prefix, _ = get_parameter_prefixes()
         path_prefix_len = len(path_prefix) + 1
 
@@ -26,16 +26,17 @@ Examples:
 """
 
 import inspect
+import logging
 from collections.abc import Callable
 from typing import Any, TypeVar
 
-from flask import make_response, request
+from flask import g, has_request_context, make_response, request
 from flask_restful import reqparse
 from pydantic import BaseModel
 
 from flask_x_openapi_schema.core.config import ConventionalPrefixConfig
+from flask_x_openapi_schema.core.content_type_utils import get_file_field_names
 from flask_x_openapi_schema.core.decorator_base import DecoratorBase, OpenAPIDecoratorBase
-from flask_x_openapi_schema.core.logger import get_logger
 from flask_x_openapi_schema.core.request_extractors import ModelFactory, request_processor, safe_operation
 from flask_x_openapi_schema.core.request_processing import preprocess_request_data
 from flask_x_openapi_schema.i18n.i18n_string import I18nStr
@@ -45,6 +46,8 @@ from flask_x_openapi_schema.models.file_models import FileField
 from flask_x_openapi_schema.models.responses import OpenAPIMetaResponse
 from flask_x_openapi_schema.x.flask_restful.utils import create_reqparse_from_pydantic
 
+logger = logging.getLogger(__name__)
+
 
 class FlaskRestfulOpenAPIDecorator(DecoratorBase):
     """OpenAPI metadata decorator for Flask-RESTful Resource.
@@ -66,7 +69,7 @@ class FlaskRestfulOpenAPIDecorator(DecoratorBase):
         prefix_config (ConventionalPrefixConfig | None): Configuration for parameter prefixes.
         framework (str): The framework being used ('flask_restful').
         base_decorator (OpenAPIDecoratorBase | None): The base decorator instance.
-        parsed_args (Any | None): Parsed arguments from request parser.
+        parsed_args (Any | None): Parsed arguments from request parser, scoped to the current request.
 
     """
 
@@ -124,7 +127,32 @@ class FlaskRestfulOpenAPIDecorator(DecoratorBase):
         )
         self.framework = "flask_restful"
         self.base_decorator = None
-        self.parsed_args = None
+        self._parsed_args_key = f"_flask_x_openapi_schema_parsed_args_{id(self)}"
+        self._parsed_args = None
+        # Request parsers are built from the model's JSON schema, so build each one once
+        self._parsers: dict[tuple[type[BaseModel], str], reqparse.RequestParser] = {}
+
+    @property
+    def parsed_args(self) -> Any | None:
+        """Get the arguments parsed for the current request.
+
+        The decorator instance is shared by every request to the endpoint, so
+        parsed arguments are kept on ``flask.g`` while a request is active.
+
+        Returns:
+            The parsed arguments, or None if nothing has been parsed yet.
+
+        """
+        if has_request_context():
+            return g.get(self._parsed_args_key)
+        return self._parsed_args
+
+    @parsed_args.setter
+    def parsed_args(self, value: Any | None) -> None:
+        if has_request_context():
+            setattr(g, self._parsed_args_key, value)
+        else:
+            self._parsed_args = value
 
     def __call__(self, func: Callable[..., Any]) -> Callable[..., Any]:
         """Apply the decorator to the function.
@@ -220,8 +248,7 @@ class FlaskRestfulOpenAPIDecorator(DecoratorBase):
             Updated kwargs dictionary with the model instance
 
         """
-        logger = get_logger(__name__)
-        logger.debug(f"Processing request body for {param_name} with model {model.__name__}")
+        logger.debug("Processing request body for %s with model %s", param_name, model.__name__)
 
         is_multipart = False
         if hasattr(model, "model_config"):
@@ -251,7 +278,7 @@ class FlaskRestfulOpenAPIDecorator(DecoratorBase):
 
         json_model_instance = request_processor.process_request_data(request, model, param_name)
         if json_model_instance:
-            logger.debug(f"Successfully created model instance from request data for {param_name}")
+            logger.debug("Successfully created model instance from request data for %s", param_name)
             kwargs[param_name] = json_model_instance
             return kwargs
 
@@ -270,7 +297,7 @@ class FlaskRestfulOpenAPIDecorator(DecoratorBase):
         else:
             parser_location = "form" if is_multipart else "json"
 
-        logger.debug(f"Using parser location: {parser_location}")
+        logger.debug("Using parser location: %s", parser_location)
 
         parser = self._get_or_create_parser(model, location=parser_location)
         self.parsed_args = parser.parse_args()
@@ -282,17 +309,17 @@ class FlaskRestfulOpenAPIDecorator(DecoratorBase):
                     lambda: ModelFactory.create_from_data(model, processed_data), fallback=None
                 )
                 if model_instance:
-                    logger.debug(f"Successfully created model instance from reqparse for {param_name}")
+                    logger.debug("Successfully created model instance from reqparse for %s", param_name)
                     kwargs[param_name] = model_instance
                     return kwargs
             except Exception:
                 logger.exception("Error processing reqparse data")
 
-        logger.warning(f"No valid request data found for {param_name}, creating default instance")
+        logger.warning("No valid request data found for %s, creating default instance", param_name)
         try:
             model_instance = safe_operation(lambda: model(), fallback=None)
             if model_instance:
-                logger.debug(f"Created empty model instance for {param_name}")
+                logger.debug("Created empty model instance for %s", param_name)
                 kwargs[param_name] = model_instance
         except Exception:
             logger.exception("Failed to create default model instance")
@@ -309,22 +336,7 @@ class FlaskRestfulOpenAPIDecorator(DecoratorBase):
             True if the model has file fields, False otherwise
 
         """
-        if not hasattr(model, "model_fields"):
-            return False
-
-        for field_info in model.model_fields.values():
-            field_type = field_info.annotation
-
-            if inspect.isclass(field_type) and issubclass(field_type, FileField):
-                return True
-
-            origin = getattr(field_type, "__origin__", None)
-            if origin is list or origin is list:
-                args = getattr(field_type, "__args__", [])
-                if args and isinstance(args[0], type) and issubclass(args[0], FileField):
-                    return True
-
-        return False
+        return bool(get_file_field_names(model))
 
     def _process_file_upload_model(self, model: type[BaseModel]) -> BaseModel:
         """Process a file upload model with form data and files.
@@ -336,29 +348,12 @@ class FlaskRestfulOpenAPIDecorator(DecoratorBase):
             An instance of the model with file data
 
         """
-        logger = get_logger(__name__)
-        logger.debug(f"Processing file upload model for {model.__name__}")
+        logger.debug("Processing file upload model for %s", model.__name__)
 
         model_data = dict(request.form.items())
-        logger.debug(f"Form data: {model_data}")
-
-        has_file_fields = False
-        file_field_names = []
+        logger.debug("Form data: %s", model_data)
 
-        for field_name, field_info in model.model_fields.items():
-            field_type = field_info.annotation
-
-            if inspect.isclass(field_type) and issubclass(field_type, FileField):
-                has_file_fields = True
-                file_field_names.append(field_name)
-                continue
-
-            origin = getattr(field_type, "__origin__", None)
-            if origin is list or origin is list:
-                args = getattr(field_type, "__args__", [])
-                if args and isinstance(args[0], type) and issubclass(args[0], FileField):
-                    has_file_fields = True
-                    file_field_names.append(field_name)
+        file_field_names = get_file_field_names(model)
 
         files_found = False
 
@@ -369,20 +364,20 @@ class FlaskRestfulOpenAPIDecorator(DecoratorBase):
                 if field_name in request.files:
                     model_data[field_name] = request.files[field_name]
                     files_found = True
-                    logger.debug(f"Found file for field {field_name}: {request.files[field_name].filename}")
+                    logger.debug("Found file for field %s: %s", field_name, request.files[field_name].filename)
                 elif "file" in request.files and field_name == "file":
                     model_data[field_name] = request.files["file"]
                     files_found = True
-                    logger.debug(f"Using default file for field {field_name}: {request.files['file'].filename}")
+                    logger.debug("Using default file for field %s: %s", field_name, request.files["file"].filename)
                 elif "avatar" in request.files and field_name == "avatar":
                     model_data[field_name] = request.files["avatar"]
                     files_found = True
-                    logger.debug(f"Using avatar file for field {field_name}: {request.files['avatar'].filename}")
+                    logger.debug("Using avatar file for field %s: %s", field_name, request.files["avatar"].filename)
                 elif len(request.files) == 1:
                     file_key = next(iter(request.files))
                     model_data[field_name] = request.files[file_key]
                     files_found = True
-                    logger.debug(f"Using single file for field {field_name}: {request.files[file_key].filename}")
+                    logger.debug("Using single file for field %s: %s", field_name, request.files[file_key].filename)
 
             else:
                 origin = getattr(field_type, "__origin__", None)
@@ -396,7 +391,7 @@ class FlaskRestfulOpenAPIDecorator(DecoratorBase):
                                     model_data[field_name] = files_list
                                     files_found = True
                                     logger.debug(
-                                        f"Found multiple files for field {field_name}: {len(files_list)} files"
+                                        "Found multiple files for field %s: %d files", field_name, len(files_list)
                                     )
                         else:
                             all_files = []
@@ -409,15 +404,15 @@ class FlaskRestfulOpenAPIDecorator(DecoratorBase):
                             if all_files:
                                 model_data[field_name] = all_files
                                 files_found = True
-                                logger.debug(f"Collected all files for field {field_name}: {len(all_files)} files")
+                                logger.debug("Collected all files for field %s: %d files", field_name, len(all_files))
 
-        if has_file_fields and not files_found:
-            logger.warning(f"No files found for file fields: {file_field_names}")
+        if file_field_names and not files_found:
+            logger.warning("No files found for file fields: %s", list(file_field_names))
             error_message = f"No files found for required fields: {', '.join(file_field_names)}"
             return self.default_error_response(error="FILE_REQUIRED", message=error_message)
 
         processed_data = preprocess_request_data(model_data, model)
-        logger.debug(f"Processed data: {processed_data}")
+        logger.debug("Processed data: %s", processed_data)
 
         try:
             return ModelFactory.create_from_data(model, processed_data)
@@ -437,13 +432,19 @@ class FlaskRestfulOpenAPIDecorator(DecoratorBase):
             A RequestParser instance for the model
 
         """
+        parser = self._parsers.get((model, location))
+        if parser is not None:
+            return parser
+
         if location == "binary":
-            logger = get_logger(__name__)
             logger.debug("Using binary parser, will handle raw data separately")
 
-            return reqparse.RequestParser(bundle_errors=True)
+            parser = reqparse.RequestParser(bundle_errors=True)
+        else:
+            parser = create_reqparse_from_pydantic(model=model, location=location)
 
-        return create_reqparse_from_pydantic(model=model, location=location)
+        self._parsers[model, location] = parser
+        return parser
 
     def _create_model_from_args(self, model: type[BaseModel], args: dict[str, Any]) -> BaseModel:
         """Create a model instance from parsed arguments.
@@ -456,8 +457,7 @@ class FlaskRestfulOpenAPIDecorator(DecoratorBase):
             An instance of the model
 
         """
-        logger = get_logger(__name__)
-        logger.debug(f"Creating model instance for {model.__name__} from args")
+        logger.debug("Creating model instance for %s from args", model.__name__)
 
         processed_data = preprocess_request_data(args, model)
         logger.debug("Processed data", extra={"processed_data": processed_data})
@@ -520,8 +520,6 @@ class FlaskRestfulOpenAPIDecorator(DecoratorBase):
             Updated kwargs dictionary with the model instance.
 
         """
-        logger = get_logger(__name__)
-
         if self.parsed_args:
             model_instance = self._create_model_from_args(model, self.parsed_args)
             kwargs[param_name] = model_instance
@@ -535,14 +533,14 @@ class FlaskRestfulOpenAPIDecorator(DecoratorBase):
             model_instance = self._create_model_from_args(model, self.parsed_args)
             kwargs[param_name] = model_instance
         except Exception:
-            logger.exception(f"Failed to create model instance for {param_name}")
+            logger.exception("Failed to create model instance for %s", param_name)
 
             try:
                 model_instance = model()
-                logger.debug(f"Created empty model instance for {param_name}")
+                logger.debug("Created empty model instance for %s", param_name)
                 kwargs[param_name] = model_instance
             except Exception:
-                logger.exception(f"Failed to create empty model instance for {param_name}")
+                logger.exception("Failed to create empty model instance for %s", param_name)
 
         return kwargs
 
@@ -556,7 +554,7 @@ class FlaskRestfulOpenAPIDecorator(DecoratorBase):
             A RequestParser instance for the model
 
         """
-        return create_reqparse_from_pydantic(model=model, location="args")
+        return self._get_or_create_parser(model, location="args")
 
     def process_additional_params(self, kwargs: dict[str, Any], param_names: list[str]) -> dict[str, Any]:
         """Process additional framework-specific parameters.
@@ -0,0 +1,65 @@
+"""Tests for the cache module.
+
+This module tests the function metadata and model field type caches.
+"""
+
+from __future__ import annotations
+
+import pytest
+from pydantic import BaseModel, Field
+
+from flask_x_openapi_schema.core import cache
+
+
+class CacheBodyModel(BaseModel):
+    """Request body model for testing."""
+
+    name: str = Field(..., description="The name")
+    age: int = Field(..., description="The age")
+
+
+class CacheQueryModel(BaseModel):
+    """Query model for testing."""
+
+    page: int = Field(1, description="Page number")
+    name: str | None = Field(None, description="Name filter")
+
+
+def test_extract_param_types_merges_models():
+    """Test that body and query field types are merged, query taking precedence."""
+    param_types = cache.extract_param_types(CacheBodyModel, CacheQueryModel)
+
+    assert param_types == {"name": str | None, "age": int, "page": int}
+
+
+def test_extract_param_types_single_model():
+    """Test extracting parameter types when only one model is given."""
+    assert cache.extract_param_types(CacheBodyModel, None) == {"name": str, "age": int}
+    assert cache.extract_param_types(None, CacheQueryModel) == {"page": int, "name": str | None}
+
+    # A single model's cached mapping is returned without copying
+    assert cache.extract_param_types(CacheBodyModel, None) is cache.MODEL_CACHE[CacheBodyModel]
+
+
+def test_extract_param_types_no_models():
+    """Test extracting parameter types without any models."""
+    assert cache.extract_param_types(None, None) == {}
+    assert cache.extract_param_types(None, None) is cache.extract_param_types(None, None)
+
+
+def test_extract_param_types_populates_model_cache():
+    """Test that model field types are computed once and cached per model class."""
+    cache.clear_all_caches()
+    assert CacheBodyModel not in cache.MODEL_CACHE
+
+    cache.extract_param_types(CacheBodyModel, None)
+    cached = cache.MODEL_CACHE[CacheBodyModel]
+    assert cached == {"name": str, "age": int}
+    with pytest.raises(TypeError):
+        cached["name"] = int
+
+    cache.extract_param_types(CacheBodyModel, CacheQueryModel)
+    assert cache.MODEL_CACHE[CacheBodyModel] is cached
+
+    cache.clear_all_caches()
+    assert CacheBodyModel not in cache.MODEL_CACHE
@@ -5,6 +5,9 @@ This module tests the configurable parameter prefixes.
 
 from __future__ import annotations
 
+import copy
+import dataclasses
+
 import pytest
 from pydantic import BaseModel, Field
 
@@ -322,3 +325,45 @@ def test_reset_config_functions():
     finally:
         # Restore original global config
         configure_prefixes(original_config)
+
+
+@pytest.mark.serial
+def test_get_prefixes_follows_prefix_config():
+    """Test that the precomputed prefix tuple tracks configure and reset calls."""
+    original_config = GLOBAL_CONFIG_HOLDER.get()
+
+    try:
+        assert GLOBAL_CONFIG_HOLDER.get_prefixes() == ("_x_body", "_x_query", "_x_path", "_x_file")
+
+        configure_prefixes(
+            ConventionalPrefixConfig(
+                request_body_prefix="test_body",
+                request_query_prefix="test_query",
+                request_path_prefix="test_path",
+                request_file_prefix="test_file",
+            )
+        )
+        assert GLOBAL_CONFIG_HOLDER.get_prefixes() == ("test_body", "test_query", "test_path", "test_file")
+
+        reset_prefixes()
+        assert GLOBAL_CONFIG_HOLDER.get_prefixes() == ("_x_body", "_x_query", "_x_path", "_x_file")
+    finally:
+        configure_prefixes(original_config)
+
+
+@pytest.mark.serial
+def test_get_returns_independent_copy():
+    """Test that get() returns a plain copy that callers can mutate and copy."""
+    original_config = GLOBAL_CONFIG_HOLDER.get()
+
+    try:
+        configure_prefixes(ConventionalPrefixConfig(extra_options={"key": "value"}))
+
+        current_config = GLOBAL_CONFIG_HOLDER.get()
+        current_config.extra_options["key"] = "changed"
+        assert GLOBAL_CONFIG_HOLDER.get().extra_options == {"key": "value"}
+
+        assert copy.deepcopy(current_config) == current_config
+        assert dataclasses.asdict(get_openapi_config())["prefix_config"]["extra_options"] == {"key": "value"}
+    finally:
+        configure_prefixes(original_config)
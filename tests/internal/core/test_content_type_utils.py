@@ -2,6 +2,7 @@
 
 import json
 
+import pytest
 from flask import Flask
 from pydantic import BaseModel, Field
 
@@ -12,6 +13,8 @@ from flask_x_openapi_schema.core.content_type_utils import (
     DefaultStrategy,
     FormUrlencodedStrategy,
     JsonContentTypeStrategy,
+    check_for_file_fields,
+    get_file_field_names,
 )
 from flask_x_openapi_schema.models.file_models import FileField
 
@@ -43,6 +46,19 @@ class MultipleFieldsModel(BaseModel):
 class TestContentTypeRegistry:
     """Tests for ContentTypeRegistry class."""
 
+    @pytest.fixture(autouse=True)
+    def restore_registry(self):
+        """Re-register the shared registry's strategies after each test."""
+        registry = ContentTypeRegistry()
+        strategy_classes = [type(strategy) for strategy in registry.get_all_strategies()]
+        default_class = type(registry._default_strategy)
+
+        yield
+
+        registry.reset()
+        for strategy_class in strategy_classes:
+            registry.register(strategy_class, is_default=strategy_class is default_class)
+
     def test_singleton_instance(self):
         """Test that ContentTypeRegistry is a singleton."""
         registry1 = ContentTypeRegistry()
@@ -52,8 +68,7 @@ class TestContentTypeRegistry:
     def test_register_strategy(self):
         """Test registering a strategy."""
         registry = ContentTypeRegistry()
-        registry._strategies = {}  # Reset for test
-        registry._default_strategy = None
+        registry.reset()
 
         registry.register(JsonContentTypeStrategy)
         assert len(registry._strategies) == 1
@@ -62,8 +77,7 @@ class TestContentTypeRegistry:
     def test_register_default_strategy(self):
         """Test registering a default strategy."""
         registry = ContentTypeRegistry()
-        registry._strategies = {}  # Reset for test
-        registry._default_strategy = None
+        registry.reset()
 
         registry.register(DefaultStrategy, is_default=True)
         assert registry._default_strategy is not None
@@ -72,8 +86,7 @@ class TestContentTypeRegistry:
     def test_get_strategy_for_content_type(self):
         """Test getting a strategy for a content type."""
         registry = ContentTypeRegistry()
-        registry._strategies = {}  # Reset for test
-        registry._default_strategy = None
+        registry.reset()
 
         registry.register(JsonContentTypeStrategy)
         registry.register(DefaultStrategy, is_default=True)
@@ -85,6 +98,39 @@ class TestContentTypeRegistry:
         strategy = registry.get_strategy_for_content_type("unknown/content-type")
         assert isinstance(strategy, DefaultStrategy)
 
+    def test_get_strategy_for_content_type_ignores_parameters(self):
+        """Test that strategies are resolved once per media type and re-resolved after registering."""
+        registry = ContentTypeRegistry()
+        registry.reset()
+
+        registry.register(JsonContentTypeStrategy)
+
+        strategy = registry.get_strategy_for_content_type("application/json; charset=utf-8")
+        assert isinstance(strategy, JsonContentTypeStrategy)
+        assert registry.get_strategy_for_content_type("Application/JSON") is strategy
+        assert list(registry._resolved) == ["application/json"]
+
+        # Registering a strategy invalidates earlier resolutions
+        registry.register(FormUrlencodedStrategy)
+        assert registry._resolved == {}
+        strategy = registry.get_strategy_for_content_type("application/x-www-form-urlencoded; charset=utf-8")
+        assert isinstance(strategy, FormUrlencodedStrategy)
+
+    def test_reset(self):
+        """Test that reset removes strategies and resolved content types."""
+        registry = ContentTypeRegistry()
+        registry.reset()
+        registry.register(JsonContentTypeStrategy)
+        registry.register(DefaultStrategy, is_default=True)
+        registry.get_strategy_for_content_type("application/json")
+
+        registry.reset()
+        assert registry.get_all_strategies() == []
+        assert registry._default_strategy is None
+        assert registry._resolved == {}
+        with pytest.raises(ValueError, match="No strategy found"):
+            registry.get_strategy_for_content_type("application/json")
+
 
 class TestJsonContentTypeStrategy:
     """Tests for JsonContentTypeStrategy class."""
@@ -201,6 +247,26 @@ class TestFormUrlencodedStrategy:
             assert form_data == {"name": "Test", "age": "30"}
 
 
+class MultipleFilesModel(BaseModel):
+    """Test model with single and list file fields."""
+
+    title: str = ""
+    file: FileField
+    attachments: list[FileField] = Field(default_factory=list)
+
+
+def test_get_file_field_names():
+    """Test that file upload fields are detected and cached per model class."""
+    file_fields = get_file_field_names(MultipleFilesModel)
+    assert file_fields == ("file", "attachments")
+    assert get_file_field_names(MultipleFilesModel) is file_fields
+
+    assert get_file_field_names(SampleModel) == ()
+    assert get_file_field_names(object) == ()
+    assert get_file_field_names(MultipleFilesModel.model_construct()) == ()
+    assert check_for_file_fields(SampleModel()) is False
+
+
 class TestContentTypeProcessor:
     """Tests for ContentTypeProcessor class."""
 
@@ -4,6 +4,7 @@ This module provides comprehensive tests for the logger module,
 covering basic functionality, configuration options, and edge cases.
 """
 
+import importlib
 import io
 import logging
 
@@ -86,6 +87,25 @@ class TestLogger:
         logger = get_logger("flask_x_openapi_schema.test")
         assert logger.level == logging.INFO
 
+    @pytest.mark.parametrize(
+        "module_name",
+        [
+            "flask_x_openapi_schema.core.content_type_utils",
+            "flask_x_openapi_schema.core.request_extractors",
+            "flask_x_openapi_schema.x.flask_restful.decorators",
+            "flask_x_openapi_schema.x.flask.decorators",
+        ],
+    )
+    def test_module_loggers_follow_configure_logging(self, module_name):
+        """Test that module-level loggers pick up levels configured after import."""
+        module_logger = importlib.import_module(module_name).logger
+
+        configure_logging(level="DEBUG")
+        assert module_logger.isEnabledFor(logging.DEBUG)
+
+        configure_logging(level="WARNING")
+        assert not module_logger.isEnabledFor(logging.DEBUG)
+
     def test_configure_logging_with_format(self):
         """Test configure_logging with different formats."""
         # Capture log output
@@ -315,6 +315,10 @@ def test_get_or_create_query_parser():
     assert age_arg.type is int
     assert name_arg.location == "args"  # Query parameters use 'args' location
 
+    # Parsers are built once per model and location
+    assert decorator._get_or_create_query_parser(QueryModel) is parser
+    assert decorator._get_or_create_parser(QueryModel) is not parser
+
 
 @pytest.mark.skipif(flask_restful is None, reason="flask-restful not installed")
 class TestFlaskRestfulDecorators:
@@ -535,6 +539,35 @@ class TestFlaskRestfulDecorators:
             assert result["query"].name == "test"
             assert result["query"].age == 25
 
+    def test_process_query_params_not_shared_across_requests(self):
+        """Test that parsed arguments do not leak from one request into the next."""
+        from flask_restful import reqparse
+
+        from flask_x_openapi_schema.x.flask_restful.decorators import FlaskRestfulOpenAPIDecorator
+
+        class QueryModel(BaseModel):
+            name: str
+            age: int = 0
+
+        # The decorator instance is shared by every request to the endpoint
+        decorator = FlaskRestfulOpenAPIDecorator()
+
+        parser = reqparse.RequestParser()
+        parser.add_argument("name", type=str, location="args")
+        parser.add_argument("age", type=int, location="args")
+
+        with patch.object(decorator, "_get_or_create_query_parser", return_value=parser):
+            with self.app.test_request_context("/?name=first&age=1"):
+                result = decorator.process_query_params("query", QueryModel, {})
+                assert result["query"].name == "first"
+                assert result["query"].age == 1
+
+            with self.app.test_request_context("/?name=second&age=2"):
+                assert decorator.parsed_args is None
+                result = decorator.process_query_params("query", QueryModel, {})
+                assert result["query"].name == "second"
+                assert result["query"].age == 2
+
     def test_process_additional_params(self):
         """Test processing additional parameters."""
         from flask_x_openapi_schema.x.flask_restful.decorators import FlaskRestfulOpenAPIDecorator